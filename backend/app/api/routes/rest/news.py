@@ -13,7 +13,7 @@ from app.schemas.news import (
     SearchParams,
     DateFilterParams,
     CoinFilterParams,
-    CoinResponse,
+    post_from_orm,
 )
 from app.services.bookmark import is_bookmarked
 from app.models.bookmark import PostBookmark
@@ -48,10 +48,7 @@ async def _build_news_response(
 
     post_items = []
     for post in posts:
-        post_schema = PostSchema.model_validate(post, from_attributes=True)
-        post_schema.coins = [
-            CoinResponse.from_post_coin(pc) for pc in post.post_coins
-        ]
+        post_schema = post_from_orm(post)
         post_schema.is_bookmarked = post.id in bookmarked_post_ids
         post_items.append(post_schema)
 
@@ -124,10 +121,7 @@ async def get_post(
     if not post:
         raise HTTPException(status_code=404, detail="Post not found")
 
-    post_schema = PostSchema.model_validate(post, from_attributes=True)
-    post_schema.coins = [
-        CoinResponse.from_post_coin(pc) for pc in post.post_coins
-    ]
+    post_schema = post_from_orm(post)
     post_schema.is_bookmarked = await is_bookmarked(
         session=session, user_id=current_user.id, post_id=post.id
     )
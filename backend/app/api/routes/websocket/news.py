@@ -1,5 +1,6 @@
 import logging
 
+import orjson
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
 from app.core.news.websocket_manager import connection_manager
@@ -8,6 +9,8 @@ from app.deps_ws import authenticate_ws_connection
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/news", tags=["news"])
 
+PONG_MESSAGE = orjson.dumps({"type": "pong"}).decode("utf-8")
+
 
 @router.websocket("/ws/{client_id}")
 async def news_websocket(websocket: WebSocket, client_id: str):
@@ -22,9 +25,9 @@ async def news_websocket(websocket: WebSocket, client_id: str):
 
     try:
         while True:
-            data = await websocket.receive_json()
+            data = orjson.loads(await websocket.receive_text())
             if data.get("type") == "ping":
-                await websocket.send_json({"type": "pong"})
+                await websocket.send_text(PONG_MESSAGE)
     except WebSocketDisconnect:
         logger.info(f"Client {client_id} disconnected from news WebSocket")
     except Exception as e:
@@ -128,35 +128,35 @@ class CoinDeskNews:
             return
         
         try:
-            news = NewsData()
-            news.feed = "CoinDesk"
-            news.source = article.get("SOURCE_DATA", {}).get("NAME", "CoinDesk")
-            news.icon = article.get("SOURCE_DATA", {}).get("IMAGE_URL", "")
-            news.url = article.get("URL", "")
-            news.title = article.get("TITLE", "")
-            news.body = article.get("BODY", "")
-            news.image = article.get("IMAGE_URL", "")
-            
+            source_data = article.get("SOURCE_DATA", {})
+
             # Convert timestamp to datetime:
             # API provides Unix timestamp in seconds, but utility expects milliseconds
             published_ts = article.get("PUBLISHED_ON", 0)
-            news.time = datetime_from_timestamp(published_ts * 1000)
+            published_time = datetime_from_timestamp(published_ts * 1000)
             
             if settings.ENVIRONMENT == "development":
-                logger.debug(f"Raw timestamp: {published_ts}, Converted time: {news.time}")
+                logger.debug(f"Raw timestamp: {published_ts}, Converted time: {published_time}")
             
             # Simple heuristic for detecting crypto symbols (e.g., BTC, ETH)
-            news.coins = set()
+            coins = set()
             for category in article.get("CATEGORY_DATA", []):
                 category_name = category.get("NAME", "").strip()
                 if category_name.isupper() and len(category_name) <= 5:
-                    news.coins.add(category_name)
+                    coins.add(category_name)
             
-            # Default values for Twitter-specific fields
-            news.is_reply = False
-            news.is_self_reply = False
-            news.is_quote = False
-            news.is_retweet = False
+            # Build in one step (Twitter-specific fields keep their False defaults)
+            news = NewsData.model_construct(
+                feed="CoinDesk",
+                source=source_data.get("NAME", "CoinDesk"),
+                icon=source_data.get("IMAGE_URL", ""),
+                url=article.get("URL", ""),
+                title=article.get("TITLE", ""),
+                body=article.get("BODY", ""),
+                image=article.get("IMAGE_URL", ""),
+                time=published_time,
+                coins=coins,
+            )
             
             await self._callback(news)
             
@@ -5,6 +5,7 @@ from app.core.news.tree_news import TreeNews
 from app.core.news.coindesk_news import CoinDeskNews
 from app.core.news.types import NewsData
 from app.core.news.websocket_manager import ConnectionManager
+from app.schemas.news import serialize_post_for_ws
 from app.services.llms import analyse_post_sentiment
 
 logger = logging.getLogger(__name__)
@@ -66,8 +67,9 @@ class NewsIngestionService:
     async def _on_news_received(self, news_data: NewsData):
         """Process a news item and broadcast to connected clients."""
         saved_post = await self._process_and_save(news_data)
-        if saved_post:
-            from app.schemas.news import serialize_post_for_ws
+
+        # Serialise once for all recipients, and not at all if nobody is listening
+        if saved_post and self.connection_manager.active_connections:
             message = serialize_post_for_ws(saved_post)
             await self.connection_manager.broadcast(message)
 
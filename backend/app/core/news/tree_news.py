@@ -91,39 +91,45 @@ class TreeNews:
             if settings.ENVIRONMENT == "development": 
                 pretty_print(data, ",\n")
 
-            news = NewsData()
-            news.feed = "TreeNews"
+            source = data.get('source', None)
+            title = data.get('title', data.get('en', ''))
+            flags = {}
 
-            news.source = data.get('source', None)
-            news.icon = data.get('icon', '')
-            news.url = data.get('url', data.get('link', ''))
-
-            news.title = data.get('title', data.get('en', ''))
-            news.body = data.get('body', '')
-            news.image = data.get('image', '')
-            news.time = datetime_from_timestamp(data.get('time', 0))
-
-            if news.source is None:
-                news.source = "Twitter"
+            if source is None:
+                source = "Twitter"
                 
                 source_info = data.get('info', {})
                 if source_info:
-                    news.is_quote = source_info.get('isQuote', False)
-                    news.is_reply = source_info.get('isReply', False)
-                    news.is_retweet = source_info.get('isRetweet', False)
-                    news.is_self_reply = source_info.get('isSelfReply', False)
-            elif news.source == "Blogs":
-                title_split = news.title.split(":")
-                news.source = title_split[0].strip().lower().capitalize()
-                news.title = title_split[1].strip()
+                    flags = {
+                        "is_quote": source_info.get('isQuote', False),
+                        "is_reply": source_info.get('isReply', False),
+                        "is_retweet": source_info.get('isRetweet', False),
+                        "is_self_reply": source_info.get('isSelfReply', False),
+                    }
+            elif source == "Blogs":
+                title_split = title.split(":")
+                source = title_split[0].strip().lower().capitalize()
+                title = title_split[1].strip()
             else:
-                news.source = "Other"
-            
-            news.coins = {
-                suggestion['coin'] 
-                for suggestion in data.get('suggestions', []) 
-                    if 'coin' in suggestion
-            }
+                source = "Other"
+
+            # Build in one step rather than assigning fields one by one
+            news = NewsData.model_construct(
+                feed="TreeNews",
+                source=source,
+                icon=data.get('icon', ''),
+                url=data.get('url', data.get('link', '')),
+                title=title,
+                body=data.get('body', ''),
+                image=data.get('image', ''),
+                time=datetime_from_timestamp(data.get('time', 0)),
+                coins={
+                    suggestion['coin'] 
+                    for suggestion in data.get('suggestions', []) 
+                        if 'coin' in suggestion
+                },
+                **flags,
+            )
 
             await self._callback(news)
         except Exception as e:
@@ -1,6 +1,8 @@
+import asyncio
 import logging
 from typing import Optional
 
+import orjson
 from fastapi import WebSocket
 
 from app.models.user import User
@@ -13,22 +15,30 @@ class ConnectionManager:
 
     def __init__(self):
         self.active_connections: dict[WebSocket, Optional[User]] = {}
+        # Immutable view used by broadcast, rebuilt only when clients come or go
+        self._snapshot: tuple[WebSocket, ...] = ()
 
     async def add(self, websocket: WebSocket, user: Optional[User] = None):
         self.active_connections[websocket] = user
+        self._snapshot = tuple(self.active_connections)
 
     async def remove(self, websocket: WebSocket):
-        self.active_connections.pop(websocket, None)
+        if websocket in self.active_connections:
+            del self.active_connections[websocket]
+            self._snapshot = tuple(self.active_connections)
 
     async def broadcast(self, message: dict):
-        disconnected = []
-        for ws in list(self.active_connections):
-            try:
-                await ws.send_json(message)
-            except Exception:
-                disconnected.append(ws)
-        for ws in disconnected:
-            await self.remove(ws)
+        """Send the message to all clients concurrently, dropping failed ones."""
+        # Encode once for all recipients; text frames keep the client's JSON.parse working
+        text = orjson.dumps(message).decode("utf-8")
+        connections = self._snapshot
+        results = await asyncio.gather(
+            *(ws.send_text(text) for ws in connections),
+            return_exceptions=True,
+        )
+        for ws, result in zip(connections, results):
+            if isinstance(result, Exception):
+                await self.remove(ws)
 
 
 connection_manager = ConnectionManager()
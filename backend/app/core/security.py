@@ -8,6 +8,15 @@ import bcrypt
 
 from app.core.config import settings
 
+# Password rule patterns, compiled once at import
+UPPERCASE_RE = re.compile(r'[A-Z]')
+LOWERCASE_RE = re.compile(r'[a-z]')
+DIGIT_RE = re.compile(r'\d')
+SPECIAL_CHAR_RE = re.compile(r'[!@#$%^&*(),.?":{}|<>]')
+
+# Explicitly verify expiration when decoding tokens
+DECODE_OPTIONS = {"verify_exp": True}
+
 
 def validate_password(password: str) -> tuple[bool, Optional[str]]:
     """
@@ -21,19 +30,19 @@ def validate_password(password: str) -> tuple[bool, Optional[str]]:
         return False, "Password must be at least 8 characters long"
     
     # Check if password contains at least one uppercase letter
-    if not re.search(r'[A-Z]', password):
+    if not UPPERCASE_RE.search(password):
         return False, "Password must contain at least one uppercase letter"
     
     # Check if password contains at least one lowercase letter
-    if not re.search(r'[a-z]', password):
+    if not LOWERCASE_RE.search(password):
         return False, "Password must contain at least one lowercase letter"
     
     # Check if password contains at least one digit
-    if not re.search(r'\d', password):
+    if not DIGIT_RE.search(password):
         return False, "Password must contain at least one number"
     
     # Check if password contains at least one special character
-    if not re.search(r'[!@#$%^&*(),.?":{}|<>]', password):
+    if not SPECIAL_CHAR_RE.search(password):
         return False, "Password must contain at least one special character!!"
     
     return True, None
@@ -43,7 +52,7 @@ def get_password_hash(password: str) -> str:
     """Hash the provided password after validation is handled by the schema."""
     return bcrypt.hashpw(
         bytes(password, encoding="utf-8"),
-        bcrypt.gensalt()
+        bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
     )
 
 
@@ -59,40 +68,54 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
 def create_token(
     subject: str | int, 
-    token_type: str = "access"
+    token_type: str = "access",
+    expires_delta: Optional[timedelta] = None
 ) -> str:
-    if token_type == "access":
-        expire = datetime.now(timezone.utc) + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    else:
-        expire = datetime.now(timezone.utc) + timedelta(minutes=settings.REFRESH_TOKEN_EXPIRE_MINUTES)
+    """Create a signed JWT; expires_delta overrides the configured lifetime."""
+    if expires_delta is None:
+        if token_type == "access":
+            expires_delta = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        else:
+            expires_delta = timedelta(minutes=settings.REFRESH_TOKEN_EXPIRE_MINUTES)
     
+    now = datetime.now(timezone.utc)
     raw_data = {
         "type": token_type,
         "jti": str(uuid.uuid4()), # add id for blacklisting
         "sub": str(subject),
-        "iat": datetime.now(timezone.utc),
-        "exp": expire
+        "iat": now,
+        "exp": now + expires_delta
     }
     
     return jwt.encode(raw_data, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
 
 
-def create_access_token(subject: str | int) -> str:
-    return create_token(subject, token_type="access")
+def create_access_token(
+    subject: str | int, 
+    expires_delta: Optional[timedelta] = None
+) -> str:
+    return create_token(subject, token_type="access", expires_delta=expires_delta)
 
 
-def create_refresh_token(subject: str | int) -> str:
-    return create_token(subject, token_type="refresh")
+def create_refresh_token(
+    subject: str | int, 
+    expires_delta: Optional[timedelta] = None
+) -> str:
+    return create_token(subject, token_type="refresh", expires_delta=expires_delta)
 
 
 def decode_token(token: str) -> Optional[dict]:
     """Decode JWT token and return the payload, or None if token is invalid."""
+    # Reject anything that isn't header.payload.signature before invoking PyJWT
+    if not token or token.count(".") != 2:
+        return None
+
     try:
         payload = jwt.decode(
             token, 
             settings.SECRET_KEY, 
             algorithms=[settings.ALGORITHM],
-            options={"verify_exp": True}  # Explicitly verify expiration
+            options=DECODE_OPTIONS
         )
         return payload
     except jwt.exceptions.ExpiredSignatureError:
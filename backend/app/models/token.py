@@ -1,5 +1,6 @@
 from datetime import datetime
 from sqlmodel import Field
+from sqlalchemy import Index
 
 from app.models.base import Base #timestamp_field
 
@@ -12,6 +13,10 @@ class Token(Base, table=True):
     expires_at: datetime = Field(..., nullable=False)
     is_blacklisted: bool = Field(default=True, nullable=False)
 
+    __table_args__ = (
+        Index("ix_tokens_expires_at", "expires_at"),
+    )
+
     # created_at: datetime = timestamp_field()
     # updated_at: datetime = timestamp_field(onupdate=func.now())
 
@@ -80,16 +80,31 @@ class NewsFeedResponse(PaginatedResponse):
     items: List[Post]
 
 
+POST_ORM_FIELDS = tuple(
+    name for name in Post.model_fields if name not in ("coins", "is_bookmarked")
+)
+
+
+def post_from_orm(db_post) -> Post:
+    """Build the Post schema from a Post ORM model.
+    
+    Coins are taken from post_coins (which carry the price data), so the
+    ORM coins relationship is never read and doesn't need to be loaded.
+    """
+    data = {name: getattr(db_post, name) for name in POST_ORM_FIELDS}
+    data["coins"] = [
+        CoinResponse.from_post_coin(pc) for pc in db_post.post_coins
+    ]
+    return Post.model_validate(data)
+
+
 def serialize_post_for_ws(db_post) -> dict:
     """Serialize a Post ORM model into the WebSocket broadcast format.
     
     Reuses the Post Pydantic schema so REST and WebSocket responses
     stay consistent automatically.
     """
-    post_schema = Post.model_validate(db_post, from_attributes=True)
-    post_schema.coins = [
-        CoinResponse.from_post_coin(pc) for pc in db_post.post_coins
-    ]
+    post_schema = post_from_orm(db_post)
     return {
         "type": "news",
         "data": post_schema.model_dump(mode="json"),
@@ -4,7 +4,7 @@ from typing import List, Tuple, Dict, Any, Union, Literal
 
 from sqlmodel import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy.dialects.postgresql import insert
 import ccxt.async_support as ccxt_async
 
 from app.core.database import sessionmanager
@@ -29,9 +29,15 @@ async def get_trending_coins_by_mentions(
     start_of_day = datetime.combine(today, time.min)
     end_of_day = datetime.combine(today, time.max)
     
-    # Get coins mentioned in today's posts with the mention count
+    # Get coins mentioned in today's posts with the mention count and sentiment breakdown
     subquery = (
-        select(PostCoin.coin_id, func.count(Post.id).label("mention_count"))
+        select(
+            PostCoin.coin_id,
+            func.count(Post.id).label("mention_count"),
+            func.count(Post.id).filter(Post.sentiment == "Bullish").label("positive_count"),
+            func.count(Post.id).filter(Post.sentiment == "Bearish").label("negative_count"),
+            func.count(Post.id).filter(Post.sentiment == "Neutral").label("neutral_count"),
+        )
         .join(Post, Post.id == PostCoin.post_id)
         .where(Post.time >= start_of_day)
         .where(Post.time <= end_of_day)
@@ -48,7 +54,13 @@ async def get_trending_coins_by_mentions(
     offset = (page - 1) * page_size
     
     query = (
-        select(Coin, subquery.c.mention_count)
+        select(
+            Coin,
+            subquery.c.mention_count,
+            subquery.c.positive_count,
+            subquery.c.negative_count,
+            subquery.c.neutral_count,
+        )
         .join(subquery, Coin.id == subquery.c.coin_id)
         .order_by(subquery.c.mention_count.desc())
         .offset(offset)
@@ -58,26 +70,9 @@ async def get_trending_coins_by_mentions(
     result = await session.execute(query)
     results = result.all()
 
-    # Process the results with sentiment statistics
+    # Sentiment statistics come from the same aggregate, no per-coin queries
     trending_coins = []
-    for coin, mention_count in results:
-        # Get all posts mentioning this coin today
-        posts_query = (
-            select(Post)
-            .options(joinedload(Post.post_coins))  # Use post_coins instead of coins
-            .join(PostCoin, Post.id == PostCoin.post_id)
-            .where(PostCoin.coin_id == coin.id)
-            .where(Post.time >= start_of_day)
-            .where(Post.time <= end_of_day)
-        )
-        result = await session.execute(posts_query)
-        posts = result.unique().scalars().all()
-
-        # Calculate sentiment statistics
-        positive_count = sum(1 for post in posts if post.sentiment == "Bullish")
-        negative_count = sum(1 for post in posts if post.sentiment == "Bearish")
-        neutral_count = sum(1 for post in posts if post.sentiment == "Neutral")
-        
+    for coin, mention_count, positive_count, negative_count, neutral_count in results:
         # Create the trending coin object
         trending_coin = {
             "id": coin.id,
@@ -107,39 +102,49 @@ async def sync_coins_from_coingecko():
     
     logger.info(f"Fetched {len(coins_list)} coins from CoinGecko")
     
-    async with sessionmanager.session() as session:
-        for coin_data in coins_list:
-            try:
-                coin_id = coin_data.get("id")
-                symbol = coin_data.get("symbol", "").upper()
-                name = coin_data.get("name", "")
-                image_url = coin_data.get("image", "")
-                
-                if not coin_id or not symbol or not name or not image_url:
-                    continue
-                
-                # Check if coin already exists
-                stmt = select(Coin).where(Coin.symbol == symbol)
-                result = await session.execute(stmt)
-                existing_coin = result.scalar_one_or_none()
-                
-                # Update existing coin or create new one
-                if existing_coin:
-                    existing_coin.name = name
-                    existing_coin.image_url = image_url
-                    session.add(existing_coin)
-                else:
-                    new_coin = Coin(
-                        symbol=symbol,
-                        name=name,
-                        image_url=image_url
-                    )
-                    session.add(new_coin)
-            except Exception as e:
-                logger.error(f"Error processing coin {coin_data.get('symbol')}: {str(e)}")
+    # Keyed by symbol so duplicates collapse (last one wins) before the upsert
+    rows = {}
+    for coin_data in coins_list:
+        try:
+            coin_id = coin_data.get("id")
+            symbol = coin_data.get("symbol", "").upper()
+            name = coin_data.get("name", "")
+            image_url = coin_data.get("image", "")
+            
+            if not coin_id or not symbol or not name or not image_url:
                 continue
-        
-        await session.commit()
+            
+            rows[symbol] = {
+                "symbol": symbol,
+                "name": name,
+                "image_url": image_url,
+            }
+        except Exception as e:
+            logger.error(f"Error processing coin {coin_data.get('symbol')}: {str(e)}")
+            continue
+    
+    if not rows:
+        return
+    
+    # Insert new coins and update existing ones in a single statement
+    stmt = insert(Coin).values(list(rows.values()))
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Coin.symbol],
+        set_={
+            "name": stmt.excluded.name,
+            "image_url": stmt.excluded.image_url,
+            "updated_at": func.now(),
+        },
+    )
+    
+    async with sessionmanager.session() as session:
+        try:
+            await session.execute(stmt)
+            await session.commit()
+        except Exception as e:
+            await session.rollback()
+            logger.error(f"Error upserting coins: {str(e)}")
+            return
     
     logger.info("Coin synchronisation completed")
 
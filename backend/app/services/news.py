@@ -1,11 +1,12 @@
 import logging
-from typing import List, Tuple, Optional
+from typing import Any, Dict, List, Tuple, Optional
 from datetime import datetime
 
 from sqlmodel import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import or_, and_
-from sqlalchemy.orm import selectinload
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import lazyload, selectinload
 
 from app.models.coin import Coin
 from app.models.post import Post
@@ -15,6 +16,14 @@ from app.providers.market.coingecko import coingecko_client
 
 logger = logging.getLogger(__name__)
 
+# Feed pages only render post_coins (see post_from_orm), so defer the model's
+# default selectin loads of coins and bookmarks (two extra queries per page)
+FEED_LOAD_OPTIONS = (
+    selectinload(Post.post_coins).selectinload(PostCoin.coin),
+    lazyload(Post.coins),
+    lazyload(Post.post_bookmarks),
+)
+
 
 async def get_coin_by_symbol(session: AsyncSession, symbol: str) -> Optional[Coin]:
     """Get a coin by its symbol"""
@@ -23,6 +32,31 @@ async def get_coin_by_symbol(session: AsyncSession, symbol: str) -> Optional[Coi
     return result.scalar_one_or_none()
 
 
+async def get_or_create_coins(
+    session: AsyncSession, 
+    coins_data: List[Dict[str, Any]]
+) -> Dict[str, Coin]:
+    """Get coins by symbol, inserting any missing ones in a single statement"""
+    rows = {}
+    for coin_data in coins_data:
+        symbol = coin_data.get("symbol", "").upper()
+        if symbol and symbol not in rows:
+            rows[symbol] = {
+                "symbol": symbol,
+                "name": coin_data.get("name"),
+                "image_url": coin_data.get("image"),
+            }
+
+    if not rows:
+        return {}
+
+    stmt = insert(Coin).values(list(rows.values())).on_conflict_do_nothing()
+    await session.execute(stmt)
+
+    result = await session.execute(select(Coin).where(Coin.symbol.in_(rows)))
+    return {coin.symbol: coin for coin in result.scalars().all()}
+
+
 async def create_post(session: AsyncSession, post_data: NewsData, sentiment: dict) -> Post:
     """Create a post entry (article or social post) within the database"""
     item_type = 'post' if post_data.source == "Twitter" else 'article'
@@ -51,21 +85,14 @@ async def create_post(session: AsyncSession, post_data: NewsData, sentiment: dic
         coins_data = await coingecko_client.get_coins_markets(
             symbols=coins_list, include_tokens="top"
         )
+        coins = await get_or_create_coins(session, coins_data)
 
         for coin_data in coins_data:
-            symbol = coin_data.get("symbol").upper()
-            coin = await get_coin_by_symbol(session, symbol)
-            
-            # Skip coins that aren't found in database or CoinGecko
+            # Skip coins that couldn't be stored and symbols already linked
+            coin = coins.pop(coin_data.get("symbol", "").upper(), None)
             if not coin:
-                coin = Coin(
-                    symbol=symbol,
-                    name=coin_data.get("name"),
-                    image_url=coin_data.get("image")
-                )
-                session.add(coin)
-                await session.flush()
-                
+                continue
+
             news_coin = PostCoin(
                 coin_id=coin.id,
                 post_id=item.id, 
@@ -164,7 +191,7 @@ async def get_news_feed(
     # Load posts with their relationships
     stmt = (
         select(Post)
-        .options(selectinload(Post.post_coins).selectinload(PostCoin.coin))
+        .options(*FEED_LOAD_OPTIONS)
         .order_by(Post.time.desc())
         .offset(offset)
         .limit(page_size)
@@ -230,7 +257,7 @@ async def search_news(
     stmt = (
         select(Post)
         .where(where_clause)
-        .options(selectinload(Post.post_coins).selectinload(PostCoin.coin))
+        .options(*FEED_LOAD_OPTIONS)
         .order_by(Post.time.desc())
         .offset(offset)
         .limit(page_size)
@@ -3,6 +3,7 @@ from datetime import datetime
 from typing import Optional
 
 from sqlmodel import select
+from sqlalchemy import delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import sessionmanager
@@ -11,10 +12,18 @@ from app.core.security import decode_token, verify_token_type
 
 logger = logging.getLogger(__name__)
 
+PURGE_BATCH_SIZE = 1000  # rows deleted per transaction when purging
 
-async def blacklist_token(*, session: AsyncSession, token: str) -> None:
-    """Add a refresh token to the blacklist"""
-    payload = decode_token(token)
+
+async def blacklist_token(
+    *, 
+    session: AsyncSession, 
+    token: str, 
+    payload: Optional[dict] = None
+) -> None:
+    """Add a refresh token to the blacklist, reusing its payload if already decoded"""
+    if payload is None:
+        payload = decode_token(token)
     if not payload or not verify_token_type(payload, "refresh"):
         return
     
@@ -34,7 +43,6 @@ async def blacklist_token(*, session: AsyncSession, token: str) -> None:
     
     session.add(token_entry)
     await session.commit()
-    await session.refresh(token_entry)
 
 
 async def is_token_blacklisted(*, session: AsyncSession, jti: str) -> bool:
@@ -63,15 +71,27 @@ async def purge_expired_tokens() -> int:
     """Remove expired tokens from the database to prevent table size buildup"""
     try:
         async with sessionmanager.session() as session: 
-            expired_tokens = await get_expired_tokens(session=session)
-            
+            now = datetime.utcnow()
             count = 0
-            for token in expired_tokens:
-                await session.delete(token)
-                count += 1
-            
-            if count > 0:
+
+            # Delete in bounded batches so a large backlog never holds one long lock
+            while True:
+                batch_ids = (
+                    select(Token.id)
+                    .where(Token.expires_at < now)
+                    .limit(PURGE_BATCH_SIZE)
+                )
+                stmt = (
+                    delete(Token)
+                    .where(Token.id.in_(batch_ids))
+                    .execution_options(synchronize_session=False)
+                )
+                result = await session.execute(stmt)
                 await session.commit()
+
+                count += result.rowcount
+                if result.rowcount < PURGE_BATCH_SIZE:
+                    break
             
             logger.info(f"Removed {count} expired tokens from database")
             return count